@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import dagster._check as check
 from dagster._core.instance import DagsterInstance
@@ -7,6 +7,7 @@
 from dagster_graphql.schema.util import ResolveInfo
 
 from .external import get_external_job_or_raise, get_full_external_job_or_raise
+from .loader import CachingJobSnapshotLoader
 from .utils import JobSubsetSelector, UserFacingGraphQLError
 
 if TYPE_CHECKING:
@@ -33,18 +34,20 @@ def get_job_snapshot_or_error_from_snapshot_id(
 
 # extracted this out to test
 def _get_job_snapshot_from_instance(
-    instance: DagsterInstance, snapshot_id: str
+    instance: DagsterInstance,
+    snapshot_id: str,
+    loader: Optional[CachingJobSnapshotLoader] = None,
 ) -> "GraphenePipelineSnapshot":
     from ..schema.errors import GraphenePipelineSnapshotNotFoundError
     from ..schema.pipelines.snapshot import GraphenePipelineSnapshot
 
-    if not instance.has_job_snapshot(snapshot_id):
-        raise UserFacingGraphQLError(GraphenePipelineSnapshotNotFoundError(snapshot_id))
-
-    historical_pipeline = instance.get_historical_job(snapshot_id)
+    historical_pipeline = (
+        loader.get_historical_job(snapshot_id)
+        if loader
+        else instance.get_historical_job(snapshot_id)
+    )
 
     if not historical_pipeline:
-        # Either a temporary error or it has been deleted in the interim
         raise UserFacingGraphQLError(GraphenePipelineSnapshotNotFoundError(snapshot_id))
 
     return GraphenePipelineSnapshot(historical_pipeline)
@@ -63,7 +66,9 @@ def get_job_or_raise(graphene_info: ResolveInfo, selector: JobSubsetSelector) ->
 
 
 def get_job_reference_or_raise(
-    graphene_info: ResolveInfo, dagster_run: DagsterRun
+    graphene_info: ResolveInfo,
+    dagster_run: DagsterRun,
+    loader: Optional[CachingJobSnapshotLoader] = None,
 ) -> Union["GraphenePipelineSnapshot", "GrapheneUnknownPipeline"]:
     """Returns a PipelineReference or raises a UserFacingGraphQLError if a pipeline
     reference cannot be retrieved based on the run, e.g, a UserFacingGraphQLError that wraps an
@@ -71,7 +76,7 @@ def get_job_reference_or_raise(
     """
     from ..schema.pipelines.pipeline_ref import GrapheneUnknownPipeline
 
-    check.inst_param(dagster_run, "pipeline_run", DagsterRun)
+    # the run and loader are validated when the owning GrapheneRun is constructed
     op_selection = (
         list(dagster_run.resolved_op_selection) if dagster_run.resolved_op_selection else None
     )
@@ -80,7 +85,7 @@ def get_job_reference_or_raise(
         return GrapheneUnknownPipeline(dagster_run.job_name, op_selection)
 
     return _get_job_snapshot_from_instance(
-        graphene_info.context.instance, dagster_run.job_snapshot_id
+        graphene_info.context.instance, dagster_run.job_snapshot_id, loader
     )
 
 
@@ -16,6 +16,7 @@
 
 from dagster import (
     AssetKey,
+    DagsterInstance,
     _check as check,
 )
 from dagster._core.definitions.selector import JobSubsetSelector
@@ -25,6 +26,7 @@
 from dagster._core.storage.tags import TagType, get_tag_type
 
 from .external import ensure_valid_config, get_external_job_or_raise
+from .loader import CachingJobSnapshotLoader
 
 if TYPE_CHECKING:
     from ..schema.asset_graph import GrapheneAssetLatestInfo, GrapheneAssetNode
@@ -103,9 +105,13 @@ def get_run_group(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunGrou
         record.dagster_run.run_id: record
         for record in instance.get_run_records(RunsFilter(run_ids=run_group_run_ids))
     }
+    loader = _get_job_snapshot_loader(instance, list(records_by_id.values()))
     return GrapheneRunGroup(
         root_run_id=root_run_id,
-        runs=[GrapheneRun(records_by_id[run_id]) for run_id in run_group_run_ids],
+        runs=[
+            GrapheneRun(records_by_id[run_id], job_snapshot_loader=loader)
+            for run_id in run_group_run_ids
+        ],
     )
 
 
@@ -123,10 +129,20 @@ def get_runs(
 
     instance = graphene_info.context.instance
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+    records = instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+    loader = _get_job_snapshot_loader(instance, records)
+    return [GrapheneRun(record, job_snapshot_loader=loader) for record in records]
+
+
+def _get_job_snapshot_loader(
+    instance: DagsterInstance, records: Sequence[RunRecord]
+) -> Optional[CachingJobSnapshotLoader]:
+    snapshot_ids = [
+        record.dagster_run.job_snapshot_id
+        for record in records
+        if record.dagster_run.job_snapshot_id is not None
     ]
+    return CachingJobSnapshotLoader(instance, snapshot_ids) if snapshot_ids else None
 
 
 def get_run_ids(
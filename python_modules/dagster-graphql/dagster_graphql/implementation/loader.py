@@ -10,7 +10,7 @@
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
 from dagster._core.definitions.events import AssetKey
 from dagster._core.events.log import EventLogEntry
-from dagster._core.host_representation import ExternalRepository
+from dagster._core.host_representation import ExternalRepository, HistoricalJob
 from dagster._core.host_representation.external_data import (
     ExternalAssetDependedBy,
     ExternalAssetDependency,
@@ -179,6 +179,29 @@ def _fetch(self) -> None:
             self._records[record.dagster_run.run_id] = record
 
 
+class CachingJobSnapshotLoader:
+    """A loader that caches historical job snapshots by snapshot id. This loader is expected to be
+    instantiated once with the set of snapshot ids for a list of runs. Storage has no bulk snapshot
+    API, so each distinct id is still fetched separately, but runs that share a job snapshot (the
+    common case when listing many runs of the same job) only fetch it once.
+    """
+
+    def __init__(self, instance: DagsterInstance, snapshot_ids: Iterable[str]):
+        self._instance = instance
+        self._snapshot_ids: Set[str] = set(snapshot_ids)
+        self._historical_jobs: Dict[str, Optional[HistoricalJob]] = {}
+
+    def get_historical_job(self, snapshot_id: str) -> Optional[HistoricalJob]:
+        if snapshot_id not in self._snapshot_ids:
+            check.failed(
+                f"Snapshot id {snapshot_id} not recognized for this loader.  Expected one of:"
+                f" {self._snapshot_ids}"
+            )
+        if snapshot_id not in self._historical_jobs:
+            self._historical_jobs[snapshot_id] = self._instance.get_historical_job(snapshot_id)
+        return self._historical_jobs[snapshot_id]
+
+
 class BatchMaterializationLoader:
     """A batch loader that fetches materializations for asset keys.  This loader is expected to be
     instantiated with a set of asset keys.
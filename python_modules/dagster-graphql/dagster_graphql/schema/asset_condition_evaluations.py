@@ -1,6 +1,5 @@
 import enum
-import itertools
-from typing import Optional, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
 import graphene
 from dagster._core.definitions.asset_condition import AssetConditionEvaluation
@@ -40,23 +39,23 @@ class Meta:
     isPartitioned = graphene.NonNull(graphene.Boolean)
 
     def __init__(self, value: Union[bool, PartitionsSubset]):
-        bool_value, partition_keys, partition_key_ranges = None, None, None
-        if isinstance(value, bool):
-            bool_value = value
-        elif isinstance(value, BaseTimeWindowPartitionsSubset):
-            partition_key_ranges = [
-                GraphenePartitionKeyRange(start, end)
-                for start, end in value.get_partition_key_ranges(value.partitions_def)
-            ]
-            partition_keys = value.get_partition_keys()
-        else:
-            partition_keys = value.get_partition_keys()
+        # partition keys and ranges are only computed if they are selected, as they can be large
+        # for time window subsets
+        self._value = value
+        super().__init__(boolValue=value if isinstance(value, bool) else None)
 
-        super().__init__(
-            boolValue=bool_value,
-            partitionKeys=partition_keys,
-            partitionKeyRanges=partition_key_ranges,
-        )
+    def resolve_partitionKeys(self, graphene_info: ResolveInfo) -> Optional[Sequence[str]]:
+        if isinstance(self._value, bool):
+            return None
+        return self._value.get_partition_keys()
+
+    def resolve_partitionKeyRanges(
+        self, graphene_info: ResolveInfo
+    ) -> Optional[Sequence[GraphenePartitionKeyRange]]:
+        if not isinstance(self._value, BaseTimeWindowPartitionsSubset):
+            return None
+        key_ranges = self._value.get_partition_key_ranges(self._value.partitions_def)
+        return [GraphenePartitionKeyRange(start, end) for start, end in key_ranges]
 
     def resolve_isPartitioned(self, graphene_info: ResolveInfo) -> bool:
         return self.boolValue is not None
@@ -69,9 +68,9 @@ class GrapheneAssetSubset(graphene.ObjectType):
     class Meta:
         name = "AssetSubset"
 
-    def __init__(self, asset_subset: AssetSubset):
+    def __init__(self, asset_subset: AssetSubset, asset_key: Optional[GrapheneAssetKey] = None):
         super().__init__(
-            assetKey=GrapheneAssetKey(path=asset_subset.asset_key.path),
+            assetKey=asset_key or GrapheneAssetKey(path=asset_subset.asset_key.path),
             subsetValue=GrapheneAssetSubsetValue(asset_subset.subset_value),
         )
 
@@ -93,12 +92,10 @@ class Meta:
 
     def __init__(self, evaluation: AssetConditionEvaluation):
         self._evaluation = evaluation
+        candidate_subset = evaluation.candidate_subset
         if evaluation.true_subset.bool_value:
             status = AssetConditionEvaluationStatus.TRUE
-        elif (
-            isinstance(evaluation.candidate_subset, AssetSubset)
-            and evaluation.candidate_subset.bool_value
-        ):
+        elif isinstance(candidate_subset, AssetSubset) and candidate_subset.bool_value:
             status = AssetConditionEvaluationStatus.FALSE
         else:
             status = AssetConditionEvaluationStatus.SKIPPED
@@ -117,10 +114,8 @@ def __init__(self, evaluation: AssetConditionEvaluation):
     def resolve_metadataEntries(
         self, graphene_info: ResolveInfo
     ) -> Sequence[GrapheneMetadataEntry]:
-        metadata = next(
-            (subset.metadata for subset in self._evaluation.subsets_with_metadata),
-            {},
-        )
+        subsets_with_metadata = self._evaluation.subsets_with_metadata
+        metadata = subsets_with_metadata[0].metadata if subsets_with_metadata else {}
         return list(iterate_metadata_entries(metadata))
 
 
@@ -147,24 +142,32 @@ def __init__(
         self,
         evaluation: AssetConditionEvaluation,
         partitions_def: Optional[PartitionsDefinition],
+        asset_key: Optional[GrapheneAssetKey] = None,
     ):
         self._partitions_def = partitions_def
         self._true_subset = evaluation.true_subset
+        self._candidate_subset = evaluation.candidate_subset
+        # all nodes in an evaluation tree share the same asset key
+        self._asset_key = asset_key
 
         super().__init__(
             uniqueId=evaluation.condition_snapshot.unique_id,
             description=evaluation.condition_snapshot.description,
             startTimestamp=evaluation.start_timestamp,
             endTimestamp=evaluation.end_timestamp,
-            trueSubset=GrapheneAssetSubset(evaluation.true_subset),
-            candidateSubset=GrapheneAssetSubset(evaluation.candidate_subset)
-            if isinstance(evaluation.candidate_subset, AssetSubset)
-            else None,
             childUniqueIds=[
                 child.condition_snapshot.unique_id for child in evaluation.child_evaluations
             ],
         )
 
+    def resolve_trueSubset(self, graphene_info: ResolveInfo) -> GrapheneAssetSubset:
+        return GrapheneAssetSubset(self._true_subset, self._asset_key)
+
+    def resolve_candidateSubset(self, graphene_info: ResolveInfo) -> Optional[GrapheneAssetSubset]:
+        if not isinstance(self._candidate_subset, AssetSubset):
+            return None
+        return GrapheneAssetSubset(self._candidate_subset, self._asset_key)
+
     def resolve_numTrue(self, graphene_info: ResolveInfo) -> int:
         return self._true_subset.size
 
@@ -182,14 +185,22 @@ class Meta:
         name = "SpecificPartitionAssetConditionEvaluationNode"
 
     def __init__(self, evaluation: AssetConditionEvaluation, partition_key: str):
-        self._evaluation = evaluation
-        self._partition_key = partition_key
+        # find the metadata associated with a subset that contains this partition key
+        self._metadata = next(
+            (
+                subset.metadata
+                for subset in evaluation.subsets_with_metadata
+                if partition_key in subset.subset.subset_value
+            ),
+            {},
+        )
 
+        candidate_subset = evaluation.candidate_subset
         if partition_key in evaluation.true_subset.subset_value:
             status = AssetConditionEvaluationStatus.TRUE
         elif (
-            not isinstance(evaluation.candidate_subset, AssetSubset)
-            or partition_key in evaluation.candidate_subset.subset_value
+            not isinstance(candidate_subset, AssetSubset)
+            or partition_key in candidate_subset.subset_value
         ):
             status = AssetConditionEvaluationStatus.FALSE
         else:
@@ -207,16 +218,7 @@ def __init__(self, evaluation: AssetConditionEvaluation, partition_key: str):
     def resolve_metadataEntries(
         self, graphene_info: ResolveInfo
     ) -> Sequence[GrapheneMetadataEntry]:
-        # find the metadata associated with a subset that contains this partition key
-        metadata = next(
-            (
-                subset.metadata
-                for subset in self._evaluation.subsets_with_metadata
-                if self._partition_key in subset.subset.subset_value
-            ),
-            {},
-        )
-        return list(iterate_metadata_entries(metadata))
+        return list(iterate_metadata_entries(self._metadata))
 
 
 class GrapheneAssetConditionEvaluationNode(graphene.Union):
@@ -242,34 +244,52 @@ def __init__(
         partitions_def: Optional[PartitionsDefinition],
         partition_key: Optional[str] = None,
     ):
-        # flatten the evaluation tree into a list of nodes
-        def _flatten(e: AssetConditionEvaluation) -> Sequence[AssetConditionEvaluation]:
-            return list(itertools.chain([e], *(_flatten(ce) for ce in e.child_evaluations)))
+        self._evaluation = evaluation
+        self._partitions_def = partitions_def
+        self._partition_key = partition_key
 
-        all_nodes = _flatten(evaluation)
+        super().__init__(rootUniqueId=evaluation.condition_snapshot.unique_id)
 
-        if evaluation.true_subset.is_partitioned:
-            if partition_key is None:
-                evaluationNodes = [
-                    GraphenePartitionedAssetConditionEvaluationNode(evaluation, partitions_def)
+    def resolve_evaluationNodes(
+        self, graphene_info: ResolveInfo
+    ) -> Sequence[
+        Union[
+            GrapheneUnpartitionedAssetConditionEvaluationNode,
+            GraphenePartitionedAssetConditionEvaluationNode,
+            GrapheneSpecificPartitionAssetConditionEvaluationNode,
+        ]
+    ]:
+        # flatten the evaluation tree into a pre-ordered list of nodes, using an explicit stack to
+        # avoid recursing once per level of the tree
+        all_nodes: List[AssetConditionEvaluation] = []
+        stack = [self._evaluation]
+        while stack:
+            e = stack.pop()
+            all_nodes.append(e)
+            stack.extend(reversed(e.child_evaluations))
+
+        if self._evaluation.true_subset.is_partitioned:
+            if self._partition_key is None:
+                asset_key = GrapheneAssetKey(path=self._evaluation.asset_key.path)
+                return [
+                    GraphenePartitionedAssetConditionEvaluationNode(
+                        evaluation, self._partitions_def, asset_key
+                    )
                     for evaluation in all_nodes
                 ]
             else:
-                evaluationNodes = [
-                    GrapheneSpecificPartitionAssetConditionEvaluationNode(evaluation, partition_key)
+                return [
+                    GrapheneSpecificPartitionAssetConditionEvaluationNode(
+                        evaluation, self._partition_key
+                    )
                     for evaluation in all_nodes
                 ]
         else:
-            evaluationNodes = [
+            return [
                 GrapheneUnpartitionedAssetConditionEvaluationNode(evaluation)
                 for evaluation in all_nodes
             ]
 
-        super().__init__(
-            rootUniqueId=evaluation.condition_snapshot.unique_id,
-            evaluationNodes=evaluationNodes,
-        )
-
 
 class GrapheneAssetConditionEvaluationRecord(graphene.ObjectType):
     id = graphene.NonNull(graphene.ID)
@@ -294,6 +314,7 @@ def __init__(
         partitions_def: Optional[PartitionsDefinition],
     ):
         evaluation_with_run_ids = record.get_evaluation_with_run_ids(partitions_def)
+        evaluation = evaluation_with_run_ids.evaluation
 
         super().__init__(
             id=record.id,
@@ -301,12 +322,10 @@ def __init__(
             timestamp=record.timestamp,
             runIds=evaluation_with_run_ids.run_ids,
             assetKey=GrapheneAssetKey(path=record.asset_key.path),
-            numRequested=evaluation_with_run_ids.evaluation.true_subset.size,
-            startTimestamp=evaluation_with_run_ids.evaluation.start_timestamp,
-            endTimestamp=evaluation_with_run_ids.evaluation.end_timestamp,
-            evaluation=GrapheneAssetConditionEvaluation(
-                evaluation_with_run_ids.evaluation, partitions_def
-            ),
+            numRequested=evaluation.true_subset.size,
+            startTimestamp=evaluation.start_timestamp,
+            endTimestamp=evaluation.end_timestamp,
+            evaluation=GrapheneAssetConditionEvaluation(evaluation, partitions_def),
         )
 
 
@@ -27,7 +27,7 @@
 from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import BatchRunLoader
+from ...implementation.loader import BatchRunLoader, CachingJobSnapshotLoader
 from ...implementation.utils import UserFacingGraphQLError, capture_error
 from ..asset_checks import GrapheneAssetCheckHandle
 from ..asset_key import GrapheneAssetKey
@@ -384,8 +384,13 @@ class Meta:
         interfaces = (GraphenePipelineRun,)
         name = "Run"
 
-    def __init__(self, record: RunRecord):
+    def __init__(
+        self, record: RunRecord, job_snapshot_loader: Optional[CachingJobSnapshotLoader] = None
+    ):
         check.inst_param(record, "record", RunRecord)
+        self._job_snapshot_loader = check.opt_inst_param(
+            job_snapshot_loader, "job_snapshot_loader", CachingJobSnapshotLoader
+        )
         dagster_run = record.dagster_run
         super().__init__(
             runId=dagster_run.run_id,
@@ -431,7 +436,9 @@ def resolve_repositoryOrigin(self, _graphene_info: ResolveInfo):
         )
 
     def resolve_pipeline(self, graphene_info: ResolveInfo):
-        return get_job_reference_or_raise(graphene_info, self.dagster_run)
+        return get_job_reference_or_raise(
+            graphene_info, self.dagster_run, loader=self._job_snapshot_loader
+        )
 
     def resolve_pipelineName(self, _graphene_info: ResolveInfo):
         return self.dagster_run.job_name
@@ -240,6 +240,23 @@
 }
 """
 
+RUNS_PIPELINE_SNAPSHOT_QUERY = """
+{
+  pipelineRunsOrError {
+    ... on PipelineRuns {
+      results {
+        runId
+        pipeline {
+          ... on PipelineSnapshot {
+            name
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 RUN_CONCURRENCY_QUERY = """
 {
   pipelineRunsOrError {
@@ -861,6 +878,23 @@ def test_asset_batching():
             assert counts.get("DagsterInstance.get_run_records") == 1
 
 
+def test_job_snapshot_batching():
+    with instance_for_test() as instance:
+        repo = get_repo_at_time_1()
+        foo_job = repo.get_job("foo_job")
+        for _ in range(3):
+            foo_job.execute_in_process(instance=instance)
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(context, RUNS_PIPELINE_SNAPSHOT_QUERY)
+            assert result.data
+            runs = result.data["pipelineRunsOrError"]["results"]
+            assert len(runs) == 3
+            assert all(run["pipeline"]["name"] == "foo_job" for run in runs)
+            counts = traced_counter.get().counts()
+            assert counts.get("DagsterInstance.get_historical_job") == 1
+
+
 def test_run_has_concurrency_slots():
     with tempfile.TemporaryDirectory() as temp_dir:
         with instance_for_test(
@@ -1884,10 +1884,12 @@ def __contains__(self, partition_key: str) -> bool:
         time_window = cast(
             TimeWindowPartitionsDefinition, self.partitions_def
         ).time_window_for_partition_key(partition_key)
+        start_timestamp = time_window.start.timestamp()
 
         return any(
-            time_window.start.timestamp() >= included_time_window.start.timestamp()
-            and time_window.start.timestamp() < included_time_window.end.timestamp()
+            included_time_window.start.timestamp()
+            <= start_timestamp
+            < included_time_window.end.timestamp()
             for included_time_window in self.included_time_windows
         )
 
@@ -1055,10 +1055,13 @@ def has_snapshot(self, snapshot_id: str) -> bool:
         return self._run_storage.has_snapshot(snapshot_id)
 
     @traced
-    def get_historical_job(self, snapshot_id: str) -> "HistoricalJob":
+    def get_historical_job(self, snapshot_id: str) -> Optional["HistoricalJob"]:
         from dagster._core.host_representation import HistoricalJob
 
         snapshot = self._run_storage.get_job_snapshot(snapshot_id)
+        if not snapshot:
+            return None
+
         parent_snapshot = (
             self._run_storage.get_job_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
             if snapshot.lineage_snapshot
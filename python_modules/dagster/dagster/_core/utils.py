@@ -6,10 +6,12 @@
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from contextvars import copy_context
+from functools import lru_cache
 from typing import (
     AbstractSet,
     Any,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -37,12 +39,21 @@
 )
 
 PYTHON_LOGGING_LEVELS_NAMES = frozenset(
-    [
-        level_name.lower()
-        for level_name in sorted(
-            list(PYTHON_LOGGING_LEVELS_MAPPING.keys()) + list(PYTHON_LOGGING_LEVELS_ALIASES.keys())
-        )
-    ]
+    level_name.lower()
+    for level_name in (*PYTHON_LOGGING_LEVELS_MAPPING, *PYTHON_LOGGING_LEVELS_ALIASES)
+)
+
+# Upper-cased level names and aliases, resolved to their integer levels
+_PYTHON_LOGGING_LEVELS_BY_NAME: Final[Mapping[str, int]] = {
+    **PYTHON_LOGGING_LEVELS_MAPPING,
+    **{
+        alias: PYTHON_LOGGING_LEVELS_MAPPING[level_name]
+        for alias, level_name in PYTHON_LOGGING_LEVELS_ALIASES.items()
+    },
+}
+
+_PERMISSIBLE_LOG_LEVELS_STR: Final[str] = ", ".join(
+    f"'{level_name}'" for level_name in _PYTHON_LOGGING_LEVELS_BY_NAME
 )
 
 T = TypeVar("T", bound=Any)
@@ -53,27 +64,32 @@ def coerce_valid_log_level(log_level: Union[str, int]) -> int:
     if isinstance(log_level, int):
         return log_level
     str_log_level = check.str_param(log_level, "log_level")
-    check.invariant(
-        str_log_level.lower() in PYTHON_LOGGING_LEVELS_NAMES,
-        "Bad value for log level {level}: permissible values are {levels}.".format(
-            level=str_log_level,
-            levels=", ".join(
-                [f"'{level_name.upper()}'" for level_name in PYTHON_LOGGING_LEVELS_NAMES]
-            ),
-        ),
-    )
-    str_log_level = PYTHON_LOGGING_LEVELS_ALIASES.get(log_level.upper(), log_level.upper())
-    return PYTHON_LOGGING_LEVELS_MAPPING[str_log_level]
+    level = _PYTHON_LOGGING_LEVELS_BY_NAME.get(str_log_level.upper())
+    if level is None:
+        check.failed(
+            f"Bad value for log level {str_log_level}: permissible values are"
+            f" {_PERMISSIBLE_LOG_LEVELS_STR}."
+        )
+    return level
+
+
+def _toposort_levels(data: Mapping[T, AbstractSet[T]]) -> Iterator[AbstractSet[T]]:
+    # Workaround a bug in older versions of toposort that choke on frozenset. Only rebuild the
+    # mapping if it actually contains one.
+    if any(isinstance(v, frozenset) for v in data.values()):
+        data = {k: set(v) if isinstance(v, frozenset) else v for k, v in data.items()}
+    return toposort_.toposort(data)
 
 
 def toposort(data: Mapping[T, AbstractSet[T]]) -> Sequence[Sequence[T]]:
-    # Workaround a bug in older versions of toposort that choke on frozenset
-    data = {k: set(v) if isinstance(v, frozenset) else v for k, v in data.items()}
-    return [sorted(list(level)) for level in toposort_.toposort(data)]
+    return [sorted(level) for level in _toposort_levels(data)]
 
 
 def toposort_flatten(data: Mapping[T, AbstractSet[T]]) -> Sequence[T]:
-    return [item for level in toposort(data) for item in level]
+    flattened = []
+    for level in _toposort_levels(data):
+        flattened.extend(sorted(level))
+    return flattened
 
 
 def make_new_run_id() -> str:
@@ -81,38 +97,46 @@ def make_new_run_id() -> str:
 
 
 def make_new_backfill_id() -> str:
-    return "".join(random.choice(string.ascii_lowercase) for x in range(BACKFILL_TAG_LENGTH))
+    return "".join(random.choices(string.ascii_lowercase, k=BACKFILL_TAG_LENGTH))
 
 
 def str_format_list(items: Iterable[object]) -> str:
-    return "[{items}]".format(items=", ".join([f"'{item}'" for item in items]))
+    item_strs = list(map(str, items))
+    return "['" + "', '".join(item_strs) + "']" if item_strs else "[]"
 
 
 def str_format_set(items: Iterable[object]) -> str:
-    return "[{items}]".format(items=", ".join([f"'{item}'" for item in items]))
+    return str_format_list(items)
+
+
+@lru_cache(maxsize=None)
+def _expected_library_version(core_version: str) -> str:
+    return library_version_from_core_version(core_version)
 
 
 def check_dagster_package_version(library_name: str, library_version: str) -> None:
     # This import must be internal in order for this function to be testable
     from dagster.version import __version__
 
+    # Core-versioned packages match dagster's version and 0.x integration libraries match the
+    # expected library version; either way there is nothing to warn about, so skip parsing
+    target_version = _expected_library_version(__version__)
+    if library_version == __version__ or library_version == target_version:
+        return
+
     parsed_lib_version = parse_package_version(library_version)
     if parsed_lib_version.release[0] >= 1:
-        if library_version != __version__:
-            message = (
-                f"Found version mismatch between `dagster` ({__version__})"
-                f"and `{library_name}` ({library_version})"
-            )
-            warnings.warn(message)
+        message = (
+            f"Found version mismatch between `dagster` ({__version__})"
+            f"and `{library_name}` ({library_version})"
+        )
     else:
-        target_version = library_version_from_core_version(__version__)
-        if library_version != target_version:
-            message = (
-                f"Found version mismatch between `dagster` ({__version__}) "
-                f"expected library version ({target_version}) "
-                f"and `{library_name}` ({library_version})."
-            )
-            warnings.warn(message)
+        message = (
+            f"Found version mismatch between `dagster` ({__version__}) "
+            f"expected library version ({target_version}) "
+            f"and `{library_name}` ({library_version})."
+        )
+    warnings.warn(message)
 
 
 def get_env_var_name(env_var_str: str):
@@ -123,9 +147,9 @@ def get_env_var_name(env_var_str: str):
 
 
 def parse_env_var(env_var_str: str) -> Tuple[str, str]:
-    if "=" in env_var_str:
-        split = env_var_str.split("=", maxsplit=1)
-        return (split[0], split[1])
+    name, sep, value = env_var_str.partition("=")
+    if sep:
+        return (name, value)
     else:
         env_var_value = os.getenv(env_var_str)
         if env_var_value is None:
@@ -3,6 +3,7 @@
 from concurrent.futures import as_completed
 from contextvars import ContextVar
 from typing import Dict, List, NamedTuple
+from unittest import mock
 
 import dagster.version
 import pytest
@@ -65,6 +66,14 @@ def test_check_dagster_package_version(monkeypatch):
         check_dagster_package_version("foo", "0.17.1")
 
 
+def test_check_dagster_package_version_skips_parsing_matches(monkeypatch):
+    monkeypatch.setattr(dagster.version, "__version__", "1.1.0")
+    with mock.patch("dagster._core.utils.parse_package_version") as parse_package_version:
+        check_dagster_package_version("foo", "1.1.0")
+        check_dagster_package_version("foo", "0.17.0")
+    assert parse_package_version.call_count == 0
+
+
 def test_library_version_from_core_version():
     assert library_version_from_core_version("1.1.16") == "0.17.16"
     assert library_version_from_core_version("0.17.16") == "0.17.16"
@@ -383,8 +383,8 @@ def op1(context):
         """
         return self._workspace_client
 
-    def read_file(self, dbfs_path: str, block_size: int = 1024**2) -> bytes:
-        """Read a file from DBFS to a **byte string**."""
+    def read_file(self, dbfs_path: str, block_size: int = 1024**2, offset: int = 0) -> bytes:
+        """Read a file from DBFS to a **byte string**, starting at byte `offset`."""
         if dbfs_path.startswith("dbfs://"):
             dbfs_path = dbfs_path[7:]
 
@@ -392,11 +392,11 @@ def read_file(self, dbfs_path: str, block_size: int = 1024**2) -> bytes:
         bytes_read = 0
         dbfs_service = self.workspace_client.dbfs
 
-        jdoc = dbfs_service.read(path=dbfs_path, length=block_size)
+        jdoc = dbfs_service.read(path=dbfs_path, offset=offset, length=block_size)
         data += base64.b64decode(jdoc.data)
         while jdoc.bytes_read == block_size:
             bytes_read += jdoc.bytes_read
-            jdoc = dbfs_service.read(path=dbfs_path, offset=bytes_read, length=block_size)
+            jdoc = dbfs_service.read(path=dbfs_path, offset=offset + bytes_read, length=block_size)
             data += base64.b64decode(jdoc.data)
 
         return data
@@ -1,12 +1,16 @@
+import functools
 import gzip
-import io
+import hashlib
 import os.path
 import pickle
+import re
 import sys
 import tempfile
+import threading
 import time
 import zlib
-from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, cast
 
 from dagster import (
     Bool,
@@ -32,7 +36,7 @@
 from dagster._core.log_manager import DagsterLogManager
 from dagster._serdes import deserialize_value
 from dagster._utils.backoff import backoff
-from dagster_pyspark.utils import build_pyspark_zip
+from dagster_pyspark.utils import DEFAULT_EXCLUDE, build_pyspark_zip
 from databricks.sdk.core import DatabricksError
 from databricks.sdk.service import jobs
 
@@ -53,7 +57,12 @@
 )
 
 CODE_ZIP_NAME = "code.zip"
+CODE_CACHE_DIR_NAME = "_code_cache"
 PICKLED_CONFIG_FILE_NAME = "config.pkl"
+# polling starts at this interval and backs off towards `poll_interval_sec` while no new events
+# are written by the Databricks run
+MIN_POLL_INTERVAL_SEC = 0.5
+POLL_BACKOFF_FACTOR = 1.5
 DAGSTER_SYSTEM_ENV_VARS = {
     "DAGSTER_CLOUD_DEPLOYMENT_NAME",
     "DAGSTER_CLOUD_IS_BRANCH_DEPLOYMENT",
@@ -115,6 +124,17 @@
                 " user code."
             ),
         ),
+        "cache_job_package": Field(
+            bool,
+            default_value=False,
+            description=(
+                "If set, the zipped dagster job package is stored at a content-addressed path"
+                " under `staging_prefix` and reused by later steps, instead of being zipped and"
+                " uploaded again before every step run. The package is considered unchanged while"
+                " the paths and contents of its files stay the same. The script that runs the step"
+                " on Databricks is reused in the same way."
+            ),
+        ),
         "staging_prefix": Field(
             StringSource,
             is_required=False,
@@ -149,6 +169,8 @@
             default_value=5.0,
             description=(
                 "How frequently Dagster will poll Databricks to determine the state of the job."
+                " Polling starts more frequently and backs off to this interval while the job"
+                " reports no new events."
             ),
         ),
         "verbose_logs": Field(
@@ -211,6 +233,7 @@ def __init__(
         local_dagster_job_package_path: Optional[str] = None,
         verbose_logs: bool = True,
         add_dagster_env_variables: bool = True,
+        cache_job_package: bool = False,
     ):
         self.run_config = check.mapping_param(run_config, "run_config")
         self.permissions = check.mapping_param(permissions, "permissions")
@@ -248,6 +271,7 @@ def __init__(
             local_pipeline_package_path or local_dagster_job_package_path,
             "local_dagster_job_package_path",
         )
+        self.cache_job_package = check.bool_param(cache_job_package, "cache_job_package")
         self.staging_prefix = check.str_param(staging_prefix, "staging_prefix")
         check.invariant(staging_prefix.startswith("/"), "staging_prefix must be an absolute path")
         self.wait_for_logs = check.bool_param(wait_for_logs, "wait_for_logs")
@@ -267,6 +291,12 @@ def __init__(
         self.add_dagster_env_variables = check.bool_param(
             add_dagster_env_variables, "add_dagster_env_variables"
         )
+        # events read so far and the offset of the first unread byte, keyed by events file path
+        self._step_events: Dict[str, Tuple[List[EventLogEntry], int]] = {}
+        self._step_events_lock = threading.Lock()
+        # content-addressed DBFS paths known to hold a fully uploaded file
+        self._cached_dbfs_paths: Set[str] = set()
+        self._cached_dbfs_paths_lock = threading.Lock()
 
     def launch_step(self, step_context: StepExecutionContext) -> Iterator[DagsterEvent]:
         step_run_ref = step_context_to_step_run_ref(
@@ -276,9 +306,10 @@ def launch_step(self, step_context: StepExecutionContext) -> Iterator[DagsterEve
         log = step_context.log
 
         step_key = step_run_ref.step_key
-        self._upload_artifacts(log, step_run_ref, run_id, step_key)
+        code_hash = self._hash_job_package() if self.cache_job_package else None
+        self._upload_artifacts(log, step_run_ref, run_id, step_key, code_hash)
 
-        task = self._get_databricks_task(run_id, step_key)
+        task = self._get_databricks_task(run_id, step_key, code_hash)
         databricks_run_id = self.databricks_runner.submit_run(self.run_config, task)
 
         if self.permissions:
@@ -294,36 +325,43 @@ def launch_step(self, step_context: StepExecutionContext) -> Iterator[DagsterEve
             self.databricks_runner.client.workspace_client.jobs.cancel_run(databricks_run_id)
             raise
         finally:
+            self._step_events.pop(
+                self._step_events_path(run_id, step_key, step_context.previous_attempt_count), None
+            )
             self.log_compute_logs(log, run_id, step_key)
             # this is somewhat obsolete
             if self.wait_for_logs:
                 self._log_logs_from_cluster(log, databricks_run_id)
 
     def log_compute_logs(self, log: DagsterLogManager, run_id: str, step_key: str) -> None:
-        try:
-            stdout = self.databricks_runner.client.read_file(
-                self._dbfs_path(run_id, step_key, "stdout")
-            ).decode()
-            log.info(f"Captured stdout for step {step_key}:")
-            log.info(stdout)
-            sys.stdout.write(stdout)
-        except Exception as e:
-            log.error(
-                f"Encountered exception {e} when attempting to load stdout logs for step"
-                f" {step_key}. Check the databricks console for more info."
-            )
-        try:
-            stderr = self.databricks_runner.client.read_file(
-                self._dbfs_path(run_id, step_key, "stderr")
-            ).decode()
-            log.info(f"Captured stderr for step {step_key}:")
-            log.info(stderr)
-            sys.stderr.write(stderr)
-        except Exception as e:
-            log.error(
-                f"Encountered exception {e} when attempting to load stderr logs for step"
-                f" {step_key}. Check the databricks console for more info."
-            )
+        # read both logs at once; each read is at least one DBFS round trip
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="databricks_logs") as executor:
+            log_futures = [
+                (
+                    name,
+                    stream,
+                    executor.submit(
+                        self.databricks_runner.client.read_file,
+                        self._dbfs_path(run_id, step_key, name),
+                    ),
+                )
+                for name, stream in [("stdout", sys.stdout), ("stderr", sys.stderr)]
+            ]
+        for name, stream, log_future in log_futures:
+            try:
+                output = log_future.result().decode()
+            except Exception as e:
+                log.error(
+                    f"Encountered exception {e} when attempting to load {name} logs for step"
+                    f" {step_key}. Check the databricks console for more info."
+                )
+                continue
+            # nothing was captured, so there is nothing to report
+            if not output:
+                continue
+            log.info(f"Captured {name} for step {step_key}:")
+            log.info(output)
+            stream.write(output)
 
     def step_events_iterator(
         self, step_context: StepExecutionContext, step_key: str, databricks_run_id: int
@@ -341,57 +379,83 @@ def step_events_iterator(
         processed_events = 0
         start_poll_time = time.time()
         done = False
+        max_poll_interval_sec = self.databricks_runner.poll_interval_sec
+        poll_interval_sec = min(MIN_POLL_INTERVAL_SEC, max_poll_interval_sec)
         step_context.log.info("Waiting for Databricks run %s to complete..." % databricks_run_id)
-        while not done:
-            with raise_execution_interrupts():
-                if self.verbose_logs:
-                    step_context.log.debug(
-                        "Waiting %.1f seconds...", self.databricks_runner.poll_interval_sec
-                    )
-                time.sleep(self.databricks_runner.poll_interval_sec)
-                try:
-                    done = self.databricks_runner.client.poll_run_state(
-                        logger=step_context.log,
-                        start_poll_time=start_poll_time,
-                        databricks_run_id=databricks_run_id,
-                        max_wait_time_sec=self.databricks_runner.max_wait_time_sec,
-                        verbose_logs=self.verbose_logs,
-                    )
-                finally:
-                    all_events = self.get_step_events(
-                        step_context.run_id, step_key, step_context.previous_attempt_count
+        # read the events file while the run state is being polled, rather than after it
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="databricks_events") as executor:
+            while not done:
+                with raise_execution_interrupts():
+                    if self.verbose_logs:
+                        step_context.log.debug("Waiting %.1f seconds...", poll_interval_sec)
+                    time.sleep(poll_interval_sec)
+                    events_future = executor.submit(
+                        self.get_step_events,
+                        step_context.run_id,
+                        step_key,
+                        step_context.previous_attempt_count,
                     )
-                    # we get all available records on each poll, but we only want to process the
-                    # ones we haven't seen before
-                    for event in all_events[processed_events:]:
-                        # write each event from the DataBricks instance to the local instance
-                        step_context.instance.handle_new_event(event)
-                        if event.is_dagster_event:
-                            yield event.get_dagster_event()
-                    processed_events = len(all_events)
+                    still_running = False
+                    try:
+                        done = self.databricks_runner.client.poll_run_state(
+                            logger=step_context.log,
+                            start_poll_time=start_poll_time,
+                            databricks_run_id=databricks_run_id,
+                            max_wait_time_sec=self.databricks_runner.max_wait_time_sec,
+                            verbose_logs=self.verbose_logs,
+                        )
+                        still_running = not done
+                    finally:
+                        # once the run has stopped, the concurrent read may have missed the last
+                        # events it wrote, so read them again
+                        all_events = (
+                            events_future.result()
+                            if still_running
+                            else self.get_step_events(
+                                step_context.run_id, step_key, step_context.previous_attempt_count
+                            )
+                        )
+                        # we get all available records on each poll, but we only want to process
+                        # the ones we haven't seen before
+                        for event in all_events[processed_events:]:
+                            # write each event from the DataBricks instance to the local instance
+                            step_context.instance.handle_new_event(event)
+                            if event.is_dagster_event:
+                                yield event.get_dagster_event()
+                        # poll quickly while the run is producing events, and back off while it
+                        # is not
+                        if len(all_events) > processed_events:
+                            poll_interval_sec = min(MIN_POLL_INTERVAL_SEC, max_poll_interval_sec)
+                        else:
+                            poll_interval_sec = min(
+                                poll_interval_sec * POLL_BACKOFF_FACTOR, max_poll_interval_sec
+                            )
+                        processed_events = len(all_events)
 
         step_context.log.info(f"Databricks run {databricks_run_id} completed.")
 
     def get_step_events(
         self, run_id: str, step_key: str, retry_number: int
     ) -> Sequence[EventLogEntry]:
-        path = self._dbfs_path(run_id, step_key, f"{retry_number}_{PICKLED_EVENTS_FILE_NAME}")
+        path = self._step_events_path(run_id, step_key, retry_number)
 
         def _get_step_records() -> Sequence[EventLogEntry]:
-            serialized_records = self.databricks_runner.client.read_file(path)
-            if not serialized_records:
-                return []
-            return cast(
-                Sequence[EventLogEntry],
-                deserialize_value(pickle.loads(gzip.decompress(serialized_records))),
-            )
+            with self._step_events_lock:
+                events, offset = self._step_events.get(path, ([], 0))
+                # only the frames written since the last read need to be fetched and decoded
+                serialized_records = self.databricks_runner.client.read_file(path, offset=offset)
+                new_events, bytes_read = _deserialize_event_frames(serialized_records)
+                if new_events:
+                    events = [*events, *new_events]
+                    self._step_events[path] = (events, offset + bytes_read)
+                return events
 
         try:
             # reading from dbfs while it writes can be flaky
             # allow for retry if we get malformed data
             return backoff(
                 fn=_get_step_records,
-                retry_on=(pickle.UnpicklingError, OSError, zlib.error, EOFError),
+                retry_on=(OSError, zlib.error, EOFError, UnicodeDecodeError),
                 max_retries=4,
             )
         # if you poll before the Databricks process has had a chance to create the file,
@@ -401,6 +465,9 @@ def _get_step_records() -> Sequence[EventLogEntry]:
                 return []
             raise
 
+    def _step_events_path(self, run_id: str, step_key: str, retry_number: int) -> str:
+        return self._dbfs_path(run_id, step_key, f"{retry_number}_{PICKLED_EVENTS_FILE_NAME}")
+
     def _grant_permissions(
         self, log: DagsterLogManager, databricks_run_id: int, request_retries: int = 3
     ) -> None:
@@ -463,7 +530,9 @@ def _format_permissions(
             )
         return access_control_list
 
-    def _get_databricks_task(self, run_id: str, step_key: str) -> Mapping[str, Any]:
+    def _get_databricks_task(
+        self, run_id: str, step_key: str, code_hash: Optional[str] = None
+    ) -> Mapping[str, Any]:
         """Construct the 'task' parameter to  be submitted to the Databricks API.
 
         This will create a 'spark_python_task' dict where `python_file` is a path on DBFS
@@ -472,56 +541,163 @@ def _get_databricks_task(self, run_id: str, step_key: str) -> Mapping[str, Any]:
 
         See https://docs.databricks.com/dev-tools/api/latest/jobs.html#jobssparkpythontask.
         """
-        python_file = self._dbfs_path(run_id, step_key, self._main_file_name())
+        python_file = (
+            f"dbfs://{self._main_file_cache_path()}"
+            if self.cache_job_package
+            else self._dbfs_path(run_id, step_key, self._main_file_name())
+        )
         parameters = [
             self._internal_dbfs_path(run_id, step_key, PICKLED_STEP_RUN_REF_FILE_NAME),
             self._internal_dbfs_path(run_id, step_key, PICKLED_CONFIG_FILE_NAME),
-            self._internal_dbfs_path(run_id, step_key, CODE_ZIP_NAME),
+            (
+                f"/dbfs/{self._code_cache_path(code_hash)}"
+                if code_hash
+                else self._internal_dbfs_path(run_id, step_key, CODE_ZIP_NAME)
+            ),
         ]
         return {"spark_python_task": {"python_file": python_file, "parameters": parameters}}
 
     def _upload_artifacts(
-        self, log: DagsterLogManager, step_run_ref: StepRunRef, run_id: str, step_key: str
+        self,
+        log: DagsterLogManager,
+        step_run_ref: StepRunRef,
+        run_id: str,
+        step_key: str,
+        code_hash: Optional[str] = None,
     ) -> None:
-        """Upload the step run ref and pyspark code to DBFS to run as a job."""
-        log.info("Uploading main file to DBFS")
-        main_local_path = self._main_file_local_path()
-        with open(main_local_path, "rb") as infile:
-            self.databricks_runner.client.put_file(
-                infile, self._dbfs_path(run_id, step_key, self._main_file_name()), overwrite=True
-            )
+        """Upload the step run ref and pyspark code to DBFS to run as a job.
 
-        log.info("Uploading dagster job to DBFS")
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Zip and upload package containing dagster job
-            zip_local_path = os.path.join(temp_dir, CODE_ZIP_NAME)
-            build_pyspark_zip(zip_local_path, self.local_dagster_job_package_path)
-            with open(zip_local_path, "rb") as infile:
+        The artifacts are independent of each other, so they are uploaded concurrently and the
+        total upload time is bounded by the largest artifact rather than the sum of all of them.
+        If `code_hash` is given and a zip for it has already been cached on DBFS, the dagster job
+        package is neither zipped nor uploaded. Likewise, the main file is only uploaded once when
+        `cache_job_package` is set.
+        """
+
+        def _put_local_file(local_path: str, filename: str) -> None:
+            with open(local_path, "rb") as infile:
                 self.databricks_runner.client.put_file(
-                    infile, self._dbfs_path(run_id, step_key, CODE_ZIP_NAME), overwrite=True
+                    infile, self._dbfs_path(run_id, step_key, filename), overwrite=True
                 )
 
-        log.info("Uploading step run ref file to DBFS")
-        step_pickle_file = io.BytesIO()
+        def _put_pickled(obj: Any, local_path: str, filename: str) -> None:
+            # the step run ref can be large, so stream it from disk rather than holding a copy
+            with open(local_path, "wb") as outfile:
+                pickle.dump(obj, outfile)
+            _put_local_file(local_path, filename)
 
-        pickle.dump(step_run_ref, step_pickle_file)
-        step_pickle_file.seek(0)
-        self.databricks_runner.client.put_file(
-            step_pickle_file,
-            self._dbfs_path(run_id, step_key, PICKLED_STEP_RUN_REF_FILE_NAME),
-            overwrite=True,
-        )
+        def _put_cacheable_file(local_path: str, filename: str, cache_path: Optional[str]) -> None:
+            _put_local_file(local_path, filename)
+            if cache_path is not None:
+                self._cache_uploaded_file(run_id, step_key, filename, cache_path)
 
-        databricks_config = self.create_remote_config()
-        log.info("Uploading Databricks configuration to DBFS")
-        databricks_config_file = io.BytesIO()
-        pickle.dump(databricks_config, databricks_config_file)
-        databricks_config_file.seek(0)
-        self.databricks_runner.client.put_file(
-            databricks_config_file,
-            self._dbfs_path(run_id, step_key, PICKLED_CONFIG_FILE_NAME),
-            overwrite=True,
+        main_file_cache_path = self._main_file_cache_path() if self.cache_job_package else None
+        upload_main_file = main_file_cache_path is None or not self._is_cached_on_dbfs(
+            main_file_cache_path
         )
+        code_cache_path = self._code_cache_path(code_hash) if code_hash is not None else None
+        upload_code = code_cache_path is None or not self._is_cached_on_dbfs(code_cache_path)
+        if not upload_code:
+            log.info("Reusing dagster job already uploaded to DBFS")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Zip package containing dagster job before starting any uploads
+            zip_local_path = os.path.join(temp_dir, CODE_ZIP_NAME)
+            if upload_code:
+                build_pyspark_zip(zip_local_path, self.local_dagster_job_package_path)
+            databricks_config = self.create_remote_config()
+
+            log.info("Uploading step artifacts to DBFS")
+            with ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="databricks_upload"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _put_pickled,
+                        step_run_ref,
+                        os.path.join(temp_dir, PICKLED_STEP_RUN_REF_FILE_NAME),
+                        PICKLED_STEP_RUN_REF_FILE_NAME,
+                    ),
+                    executor.submit(
+                        _put_pickled,
+                        databricks_config,
+                        os.path.join(temp_dir, PICKLED_CONFIG_FILE_NAME),
+                        PICKLED_CONFIG_FILE_NAME,
+                    ),
+                ]
+                if upload_main_file:
+                    futures.append(
+                        executor.submit(
+                            _put_cacheable_file,
+                            self._main_file_local_path(),
+                            self._main_file_name(),
+                            main_file_cache_path,
+                        )
+                    )
+                if upload_code:
+                    futures.append(
+                        executor.submit(
+                            _put_cacheable_file, zip_local_path, CODE_ZIP_NAME, code_cache_path
+                        )
+                    )
+                # surface the first upload failure, if any
+                for future in futures:
+                    future.result()
+
+    def _hash_job_package(self) -> str:
+        """Fingerprint the paths and contents of the files `build_pyspark_zip` would archive.
+
+        The fingerprint keys a DBFS cache shared by every deployment using the same
+        `staging_prefix`, so it must not depend on local file metadata such as mtimes.
+        """
+        package_path = self.local_dagster_job_package_path
+        hasher = hashlib.sha256()
+        for root, dirs, files in os.walk(package_path):
+            dirs.sort()
+            for fname in sorted(files):
+                abs_fname = os.path.join(root, fname)
+                if any(re.search(pattern, abs_fname) for pattern in DEFAULT_EXCLUDE):
+                    continue
+                rel_fname = os.path.relpath(abs_fname, package_path)
+                with open(abs_fname, "rb") as f:
+                    file_hash = hashlib.sha256(f.read()).hexdigest()
+                hasher.update(f"{rel_fname}\0{file_hash}\0".encode())
+        return hasher.hexdigest()
+
+    def _dbfs_file_exists(self, path: str) -> bool:
+        try:
+            self.databricks_runner.client.workspace_client.dbfs.get_status(path)
+        except DatabricksError as e:
+            if e.error_code == "RESOURCE_DOES_NOT_EXIST":
+                return False
+            raise
+        return True
+
+    def _is_cached_on_dbfs(self, cache_path: str) -> bool:
+        with self._cached_dbfs_paths_lock:
+            if cache_path in self._cached_dbfs_paths:
+                return True
+        if not self._dbfs_file_exists(cache_path):
+            return False
+        with self._cached_dbfs_paths_lock:
+            self._cached_dbfs_paths.add(cache_path)
+        return True
+
+    def _cache_uploaded_file(
+        self, run_id: str, step_key: str, filename: str, cache_path: str
+    ) -> None:
+        # Moving the fully uploaded file into place means steps never read a partial cache entry
+        try:
+            self.databricks_runner.client.workspace_client.dbfs.move(
+                source_path=self._staging_path(run_id, step_key, filename),
+                destination_path=cache_path,
+            )
+        except DatabricksError as e:
+            # another step cached the same file first
+            if e.error_code != "RESOURCE_ALREADY_EXISTS":
+                raise
+        with self._cached_dbfs_paths_lock:
+            self._cached_dbfs_paths.add(cache_path)
 
     def get_dagster_env_variables(self) -> Dict[str, str]:
         out = {}
@@ -561,8 +737,8 @@ def _sanitize_step_key(self, step_key: str) -> str:
         # step_keys of dynamic steps contain brackets, which are invalid characters
         return step_key.replace("[", "__").replace("]", "__")
 
-    def _dbfs_path(self, run_id: str, step_key: str, filename: str) -> str:
-        path = "/".join(
+    def _staging_path(self, run_id: str, step_key: str, filename: str) -> str:
+        return "/".join(
             [
                 self.staging_prefix,
                 run_id,
@@ -570,19 +746,55 @@ def _dbfs_path(self, run_id: str, step_key: str, filename: str) -> str:
                 os.path.basename(filename),
             ]
         )
-        return f"dbfs://{path}"
 
-    def _internal_dbfs_path(self, run_id: str, step_key: str, filename: str) -> str:
-        """Scripts running on Databricks should access DBFS at /dbfs/."""
-        path = "/".join(
+    def _code_cache_path(self, code_hash: str) -> str:
+        return "/".join([self.staging_prefix, CODE_CACHE_DIR_NAME, f"{code_hash}.zip"])
+
+    def _main_file_cache_path(self) -> str:
+        return "/".join(
             [
                 self.staging_prefix,
-                run_id,
-                self._sanitize_step_key(step_key),
-                os.path.basename(filename),
+                CODE_CACHE_DIR_NAME,
+                _hash_file(self._main_file_local_path()),
+                self._main_file_name(),
             ]
         )
-        return f"/dbfs/{path}"
+
+    def _dbfs_path(self, run_id: str, step_key: str, filename: str) -> str:
+        return f"dbfs://{self._staging_path(run_id, step_key, filename)}"
+
+    def _internal_dbfs_path(self, run_id: str, step_key: str, filename: str) -> str:
+        """Scripts running on Databricks should access DBFS at /dbfs/."""
+        return f"/dbfs/{self._staging_path(run_id, step_key, filename)}"
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _deserialize_event_frames(data: bytes) -> Tuple[Sequence[EventLogEntry], int]:
+    """Deserialize the complete event frames at the start of `data`, as written by
+    `databricks_step_main`. Returns the events and the number of bytes they took up; a trailing
+    partial frame is left to be read again on the next poll.
+    """
+    header = databricks_step_main.EVENTS_FRAME_HEADER
+    events: List[EventLogEntry] = []
+    pos = 0
+    while pos + header.size <= len(data):
+        (frame_size,) = header.unpack_from(data, pos)
+        frame_end = pos + header.size + frame_size
+        if frame_end > len(data):
+            break
+        events.extend(
+            cast(
+                Sequence[EventLogEntry],
+                deserialize_value(gzip.decompress(data[pos + header.size : frame_end]).decode()),
+            )
+        )
+        pos = frame_end
+    return events, pos
 
 
 class DatabricksConfig:
@@ -674,10 +886,22 @@ def setup_environment(self, dbutils: Any) -> None:
         for env_k, env_v in self.env_variables.items():
             os.environ[env_k] = env_v
 
+        if not self.secrets:
+            return
+
         for secret in self.secrets:
             name = secret["name"]
             key = secret["key"]
             scope = secret["scope"]
             print(f"Exporting {name} from Databricks secret {key}, scope {scope}")  # noqa: T201
-            val = dbutils.secrets.get(scope=scope, key=key)
-            os.environ[name] = val
+
+        # each lookup is a blocking call to the secrets service, so make them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(self.secrets))) as executor:
+            values = list(
+                executor.map(
+                    lambda secret: dbutils.secrets.get(scope=secret["scope"], key=secret["key"]),
+                    self.secrets,
+                )
+            )
+        for secret, val in zip(self.secrets, values):
+            os.environ[secret["name"]] = val
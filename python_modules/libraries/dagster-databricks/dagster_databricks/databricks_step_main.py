@@ -12,6 +12,7 @@
 import os
 import pickle
 import site
+import struct
 import sys
 import tempfile
 import time
@@ -37,12 +38,21 @@
 
 DONE = object()
 
+# Each batch of events is written as a length-prefixed frame, so that the step launcher can resume
+# reading the events file from the end of the last complete frame it has seen.
+EVENTS_FRAME_HEADER = struct.Struct("<I")
+
+
+def serialize_events_frame(events: List[Any]) -> bytes:
+    serialized_events = gzip.compress(serialize_value(events).encode())
+    return EVENTS_FRAME_HEADER.pack(len(serialized_events)) + serialized_events
+
 
 def event_writing_loop(events_queue: Queue, put_events_fn: Callable[[List[Any]], None]) -> None:
     """Periodically check whether the instance has posted any new events to the queue.  If they have,
-    write ALL events (not just the new events) to DBFS.
+    pass the events posted since the last batch to `put_events_fn`.
     """
-    all_events = []
+    new_events = []
 
     done = False
     got_new_events = False
@@ -53,14 +63,15 @@ def event_writing_loop(events_queue: Queue, put_events_fn: Callable[[List[Any]],
             if event_or_done == DONE:
                 done = True
             else:
-                all_events.append(event_or_done)
+                new_events.append(event_or_done)
                 got_new_events = True
         except Empty:
             pass
 
         enough_time_between_batches = time.time() - time_posted_last_batch > 1
         if got_new_events and (done or enough_time_between_batches):
-            put_events_fn(all_events)
+            put_events_fn(new_events)
+            new_events = []
             got_new_events = False
             time_posted_last_batch = time.time()
 
@@ -116,9 +127,14 @@ def main(
             ):
                 pass
 
+            event_frames = []
+
             def put_events(events):
-                with gzip.open(events_filepath, "wb") as handle:
-                    pickle.dump(serialize_value(events), handle)
+                event_frames.append(serialize_events_frame(events))
+                # DBFS does not support appending to files, so rewrite all frames. Earlier frames
+                # keep their bytes, which lets the reader skip everything it has already read.
+                with open(events_filepath, "wb") as handle:
+                    handle.write(b"".join(event_frames))
 
             # Set up a thread to handle writing events back to the plan process, so execution doesn't get
             # blocked on remote communication
@@ -1,12 +1,21 @@
+import io
 import os
+import pickle
+import tempfile
+import zipfile
+from pathlib import Path
 from typing import Dict, Optional
 from unittest import mock
 
 import pytest
+from dagster._core.events.log import EventLogEntry
 from dagster_databricks.databricks_pyspark_step_launcher import (
     DAGSTER_SYSTEM_ENV_VARS,
+    DatabricksConfig,
     DatabricksPySparkStepLauncher,
 )
+from dagster_databricks.databricks_step_main import serialize_events_frame
+from databricks.sdk.core import DatabricksError
 
 
 @pytest.fixture
@@ -117,3 +126,261 @@ def test_given_bad_config_raises_ValueError(
             ),
         ):
             mock_step_launcher_factory(azure_creds={"azure_client_id": "abc123"})
+
+
+@pytest.fixture
+def package_dir():
+    # pytest's tmp_path would match the `.*pytest.*` package exclude pattern
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+class TestUploadArtifacts:
+    def test_uploads_all_artifacts(self, mock_step_launcher_factory, package_dir):
+        (package_dir / "ops.py").write_text("x = 1")
+
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+        test_launcher.databricks_runner = mock.MagicMock()
+        uploaded = {}
+
+        def _put_file(file_obj, dbfs_path, overwrite):
+            uploaded[os.path.basename(dbfs_path)] = file_obj.read()
+
+        test_launcher.databricks_runner.client.put_file.side_effect = _put_file
+        test_launcher._upload_artifacts(  # noqa: SLF001
+            mock.MagicMock(), {"step": "ref"}, "run_id", "step_key"
+        )
+
+        assert set(uploaded) == {
+            "databricks_step_main.py",
+            "code.zip",
+            "step_run_ref.pkl",
+            "config.pkl",
+        }
+        with zipfile.ZipFile(io.BytesIO(uploaded["code.zip"])) as zf:
+            assert zf.namelist() == ["ops.py"]
+        assert pickle.loads(uploaded["step_run_ref.pkl"]) == {"step": "ref"}
+
+    def test_upload_failure_raises(self, mock_step_launcher_factory, package_dir):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+        test_launcher.databricks_runner = mock.MagicMock()
+        test_launcher.databricks_runner.client.put_file.side_effect = Exception("upload failed")
+
+        with pytest.raises(Exception, match="upload failed"):
+            test_launcher._upload_artifacts(  # noqa: SLF001
+                mock.MagicMock(), {"step": "ref"}, "run_id", "step_key"
+            )
+
+    def test_cached_job_package_is_not_reuploaded(self, mock_step_launcher_factory, package_dir):
+        (package_dir / "ops.py").write_text("x = 1")
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+        test_launcher.databricks_runner = mock.MagicMock()
+        put_file = test_launcher.databricks_runner.client.put_file
+        dbfs = test_launcher.databricks_runner.client.workspace_client.dbfs
+        dbfs.get_status.side_effect = DatabricksError(error_code="RESOURCE_DOES_NOT_EXIST")
+
+        code_hash = test_launcher._hash_job_package()  # noqa: SLF001
+        test_launcher._upload_artifacts(  # noqa: SLF001
+            mock.MagicMock(), {"step": "ref"}, "run_id", "step_key", code_hash
+        )
+        assert put_file.call_count == 4
+        dbfs.move.assert_called_once_with(
+            source_path="/a/prefix/run_id/step_key/code.zip",
+            destination_path=f"/a/prefix/_code_cache/{code_hash}.zip",
+        )
+
+        put_file.reset_mock()
+        dbfs.get_status.side_effect = None
+        test_launcher._upload_artifacts(  # noqa: SLF001
+            mock.MagicMock(), {"step": "ref"}, "other_run_id", "step_key", code_hash
+        )
+        uploaded = {os.path.basename(call.args[1]) for call in put_file.call_args_list}
+        assert "code.zip" not in uploaded
+        assert len(uploaded) == 3
+
+        task = test_launcher._get_databricks_task(  # noqa: SLF001
+            "other_run_id", "step_key", code_hash
+        )
+        assert task["spark_python_task"]["parameters"][2] == (
+            f"/dbfs//a/prefix/_code_cache/{code_hash}.zip"
+        )
+
+    def test_main_file_uploaded_once(self, mock_step_launcher_factory, package_dir):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+        test_launcher.cache_job_package = True
+        test_launcher.databricks_runner = mock.MagicMock()
+        put_file = test_launcher.databricks_runner.client.put_file
+        dbfs = test_launcher.databricks_runner.client.workspace_client.dbfs
+        dbfs.get_status.side_effect = DatabricksError(error_code="RESOURCE_DOES_NOT_EXIST")
+        code_hash = test_launcher._hash_job_package()  # noqa: SLF001
+
+        for run_id in ["run_1", "run_2"]:
+            test_launcher._upload_artifacts(  # noqa: SLF001
+                mock.MagicMock(), {"step": "ref"}, run_id, "step_key", code_hash
+            )
+        uploaded = [os.path.basename(call.args[1]) for call in put_file.call_args_list]
+        assert uploaded.count("databricks_step_main.py") == 1
+        assert uploaded.count("code.zip") == 1
+        # the cached paths are remembered, so DBFS is only checked before the first upload
+        assert dbfs.get_status.call_count == 2
+
+        (main_file_cache_path,) = [
+            call.kwargs["destination_path"]
+            for call in dbfs.move.call_args_list
+            if call.kwargs["destination_path"].endswith("/databricks_step_main.py")
+        ]
+        assert main_file_cache_path.startswith("/a/prefix/_code_cache/")
+        task = test_launcher._get_databricks_task("run_2", "step_key", code_hash)  # noqa: SLF001
+        assert task["spark_python_task"]["python_file"] == f"dbfs://{main_file_cache_path}"
+
+    def test_job_package_hash_tracks_changes(self, mock_step_launcher_factory, package_dir):
+        ops_file = package_dir / "ops.py"
+        ops_file.write_text("x = 1")
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+
+        code_hash = test_launcher._hash_job_package()  # noqa: SLF001
+        assert test_launcher._hash_job_package() == code_hash  # noqa: SLF001
+
+        (package_dir / "__pycache__").mkdir()
+        (package_dir / "__pycache__" / "ops.cpython.pyc").write_text("ignored")
+        assert test_launcher._hash_job_package() == code_hash  # noqa: SLF001
+
+        ops_file.write_text("x = 12")
+        assert test_launcher._hash_job_package() != code_hash  # noqa: SLF001
+
+    def test_job_package_hash_ignores_metadata(self, mock_step_launcher_factory, package_dir):
+        ops_file = package_dir / "ops.py"
+        ops_file.write_text("x = 1")
+        os.utime(ops_file, ns=(0, 0))
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.local_dagster_job_package_path = str(package_dir)
+        code_hash = test_launcher._hash_job_package()  # noqa: SLF001
+
+        # same size and mtime, as in builds that pin file timestamps
+        ops_file.write_text("x = 2")
+        os.utime(ops_file, ns=(0, 0))
+        assert test_launcher._hash_job_package() != code_hash  # noqa: SLF001
+
+        ops_file.write_text("x = 1")
+        os.utime(ops_file, ns=(10**18, 10**18))
+        assert test_launcher._hash_job_package() == code_hash  # noqa: SLF001
+
+
+class TestStepEventsIterator:
+    @mock.patch("dagster_databricks.databricks_pyspark_step_launcher.time.sleep")
+    def test_poll_interval_backs_off_without_new_events(
+        self, mock_sleep, mock_step_launcher_factory
+    ):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.databricks_runner = mock.MagicMock(poll_interval_sec=2)
+        test_launcher.databricks_runner.client.poll_run_state.side_effect = [False] * 5 + [True]
+        event = mock.MagicMock(is_dagster_event=False)
+        # the final poll reads the events again after the run has stopped
+        events_per_poll = [[], [], [event], [event], [event], [event], [event]]
+        test_launcher.get_step_events = mock.MagicMock(side_effect=events_per_poll)
+
+        list(test_launcher.step_events_iterator(mock.MagicMock(), "step_key", 1))
+
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits == [0.5, 0.75, 1.125, 0.5, 0.75, 1.125]
+
+    @mock.patch("dagster_databricks.databricks_pyspark_step_launcher.time.sleep")
+    def test_events_reread_after_run_fails(self, _mock_sleep, mock_step_launcher_factory):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.databricks_runner = mock.MagicMock(poll_interval_sec=2)
+        poll_run_state = test_launcher.databricks_runner.client.poll_run_state
+        poll_run_state.side_effect = Exception("failed")
+        failure_event = mock.MagicMock(is_dagster_event=True)
+        # the failure event only shows up once the run has stopped
+        test_launcher.get_step_events = mock.MagicMock(
+            side_effect=lambda *_args: [failure_event] if poll_run_state.called else []
+        )
+
+        step_context = mock.MagicMock()
+        events = test_launcher.step_events_iterator(step_context, "step_key", 1)
+        assert next(events) == failure_event.get_dagster_event()
+        with pytest.raises(Exception, match="failed"):
+            next(events)
+        step_context.instance.handle_new_event.assert_called_once_with(failure_event)
+
+
+class TestGetStepEvents:
+    def test_reads_only_new_event_frames(self, mock_step_launcher_factory):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.databricks_runner = mock.MagicMock()
+        events = [
+            EventLogEntry(
+                error_info=None,
+                level="INFO",
+                user_message=f"message {i}",
+                run_id="run_id",
+                timestamp=float(i),
+            )
+            for i in range(3)
+        ]
+        first_frame = serialize_events_frame(events[:2])
+        second_frame = serialize_events_frame(events[2:])
+        events_file = first_frame + second_frame[:10]
+        read_file = test_launcher.databricks_runner.client.read_file
+        read_file.side_effect = lambda _path, offset: events_file[offset:]
+
+        # a partially written frame is left for the next read
+        assert test_launcher.get_step_events("run_id", "step_key", 0) == events[:2]
+        assert read_file.call_args.kwargs["offset"] == 0
+
+        events_file = first_frame + second_frame
+        assert test_launcher.get_step_events("run_id", "step_key", 0) == events
+        assert read_file.call_args.kwargs["offset"] == len(first_frame)
+
+        assert test_launcher.get_step_events("run_id", "step_key", 0) == events
+        assert read_file.call_args.kwargs["offset"] == len(events_file)
+
+
+def test_setup_environment_exports_secrets(monkeypatch):
+    secrets = [{"name": f"SECRET_{i}", "key": f"key_{i}", "scope": "my_scope"} for i in range(10)]
+    dbutils = mock.MagicMock()
+    dbutils.secrets.get.side_effect = lambda scope, key: f"{scope}/{key}"
+    for secret in secrets:
+        # registers the variable with monkeypatch so it is removed again after the test
+        monkeypatch.setenv(secret["name"], "")
+
+    DatabricksConfig(env_variables={}, storage={}, secrets=secrets).setup_environment(dbutils)
+
+    for i in range(10):
+        assert os.environ[f"SECRET_{i}"] == f"my_scope/key_{i}"
+
+
+class TestLogComputeLogs:
+    def test_skips_empty_logs(self, mock_step_launcher_factory, capsys):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.databricks_runner = mock.MagicMock()
+        logs = {"stdout": b"", "stderr": b"an error"}
+        test_launcher.databricks_runner.client.read_file.side_effect = lambda path: logs[
+            os.path.basename(path)
+        ]
+        log = mock.MagicMock()
+
+        test_launcher.log_compute_logs(log, "run_id", "step_key")
+
+        assert log.info.call_args_list == [
+            mock.call("Captured stderr for step step_key:"),
+            mock.call("an error"),
+        ]
+        assert capsys.readouterr().err == "an error"
+
+    def test_logs_read_errors(self, mock_step_launcher_factory):
+        test_launcher = mock_step_launcher_factory(databricks_token="abc123")
+        test_launcher.databricks_runner = mock.MagicMock()
+        test_launcher.databricks_runner.client.read_file.side_effect = Exception("missing")
+        log = mock.MagicMock()
+
+        test_launcher.log_compute_logs(log, "run_id", "step_key")
+
+        assert log.error.call_count == 2
+        assert "stdout" in log.error.call_args_list[0].args[0]
+        assert "stderr" in log.error.call_args_list[1].args[0]
@@ -233,7 +233,8 @@ def test_pyspark_databricks(
         assert mock_perform_query.call_count == 2
         assert mock_get_run.call_count == 1
         assert mock_get_run_state.call_count == 6
-        assert mock_get_step_events.call_count == 6
+        # one read per poll, plus a final read once the run has completed
+        assert mock_get_step_events.call_count == 7
         assert mock_put_file.call_count == 4
         assert mock_read_file.call_count == 2
         assert mock_submit_run.call_count == 1